@@ -3,6 +3,7 @@
  */
 
 import { Config } from "./types";
+import { PARSE_CACHE_FILE } from "./test-parser";
 
 /**
  * Load configuration from environment variables and CLI args
@@ -16,6 +17,9 @@ export function loadConfig(): Config {
   const saveOutputs = process.env.SAVE_OUTPUTS !== "false";
   const outputDir = process.env.OUTPUT_DIR || "browser-use-outputs";
   const maxConcurrency = parseInt(process.env.MAX_CONCURRENCY || "3", 10);
+  const verbose = process.env.VERBOSE === "true";
+  const parseCache = process.env.PARSE_CACHE !== "false";
+  const parseCacheFile = process.env.PARSE_CACHE_FILE || PARSE_CACHE_FILE;
   const baseUrl = process.env.BASE_URL || getCliArg("--url");
 
   // Diff-based test generation options
@@ -37,6 +41,9 @@ export function loadConfig(): Config {
     saveOutputs,
     outputDir,
     maxConcurrency,
+    verbose,
+    parseCache,
+    parseCacheFile,
     fromCommit,
     openaiApiKey,
     testGenerationModel,
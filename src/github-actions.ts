@@ -287,21 +287,31 @@ export function addAnnotation(
  * Set output variable for GitHub Actions
  */
 export function setOutput(name: string, value: string): void {
+  setOutputs({ [name]: value });
+}
+
+/**
+ * Set multiple output variables for GitHub Actions with a single write
+ */
+export function setOutputs(outputs: Record<string, string>): void {
   if (!isGitHubActions()) {
     return;
   }
 
   const outputFile = process.env.GITHUB_OUTPUT;
+  const entries = Object.entries(outputs);
   
   if (outputFile && existsSync(outputFile)) {
     // Write to GITHUB_OUTPUT file
-    const content = `${name}=${value}\n`;
+    const content = entries.map(([name, value]) => `${name}=${value}\n`).join('');
     writeFile(outputFile, content, { flag: 'a' }).catch(error => {
       console.error('Failed to set output:', error);
     });
   } else {
     // Fallback to old format
-    console.log(`::set-output name=${name}::${value}`);
+    for (const [name, value] of entries) {
+      console.log(`::set-output name=${name}::${value}`);
+    }
   }
 }
 
@@ -315,13 +325,15 @@ export function exportTestStatistics(report: TestReport): void {
 
   const { summary } = report;
   
-  setOutput('total_tests', String(summary.total));
-  setOutput('passed_tests', String(summary.passed));
-  setOutput('failed_tests', String(summary.failed));
-  setOutput('error_tests', String(summary.errors));
-  setOutput('timeout_tests', String(summary.timeouts));
-  setOutput('not_finished_tests', String(summary.notFinished));
-  setOutput('success_rate', summary.successRate);
+  setOutputs({
+    total_tests: String(summary.total),
+    passed_tests: String(summary.passed),
+    failed_tests: String(summary.failed),
+    error_tests: String(summary.errors),
+    timeout_tests: String(summary.timeouts),
+    not_finished_tests: String(summary.notFinished),
+    success_rate: summary.successRate,
+  });
   
   console.log('✅ Exported test statistics as outputs');
 }
\ No newline at end of file
@@ -6,15 +6,26 @@
 
 import { BrowserUseClient } from "browser-use-sdk";
 import { loadConfig, validateConfig } from "./config";
-import { findTestFiles, parseTestCase } from "./test-parser";
+import {
+  findTestFiles,
+  parseTestCase,
+  createTestCaseDefaults,
+  loadParseCache,
+  saveParseCache,
+} from "./test-parser";
 import { executeTest } from "./test-executor";
 import { generateReport, printSummary, saveResults, printConfig, printHeader } from "./reporter";
-import { exists, runWithConcurrency } from "./utils";
+import { exists, runWithConcurrency, createTestResult } from "./utils";
 import { TestResult } from "./types";
 import { getGitDiff, getCommitInfo } from "./git-diff";
 import { generateTestCasesFromDiff, saveArtifacts } from "./test-generator";
 import { publishToGitHubActions, exportTestStatistics, addAnnotation } from "./github-actions";
 
+/**
+ * Maximum number of test files parsed at once
+ */
+const MAX_PARALLEL_PARSES = 32;
+
 /**
  * Main test runner class
  */
@@ -61,6 +72,9 @@ ENVIRONMENT VARIABLES:
   OUTPUT_DIR                 Directory for test outputs (default: browser-use-outputs)
   FAIL_ON_ERROR              Exit with error on test failure (default: true)
   SAVE_OUTPUTS               Save test outputs (default: true)
+  VERBOSE                    Log session, task and status progress details (default: false)
+  PARSE_CACHE                Cache parsed test files between runs (default: true)
+  PARSE_CACHE_FILE           Parse cache location (default: .monkey-test-cache/parsed.json)
 
 EXAMPLES:
   # Run existing tests
@@ -260,41 +274,49 @@ EXAMPLES:
       baseUrl: this.config.baseUrl,
     });
 
+    // Parse all test files up front, reusing cached results for unchanged
+    // files, so parsing overlaps instead of waiting on execution slots.
+    // Parsing is capped to stay well below open file descriptor limits.
+    const parseCache = this.config.parseCache
+      ? await loadParseCache(this.config.parseCacheFile)
+      : undefined;
+    const defaults = createTestCaseDefaults(this.config.timeout, this.config.llmModel);
+    const testCases = await runWithConcurrency(
+      testFiles,
+      MAX_PARALLEL_PARSES,
+      (testFile: string) => parseTestCase(testFile, defaults, parseCache)
+    );
+    if (parseCache) {
+      await saveParseCache(parseCache, this.config.parseCacheFile);
+    }
+
     // Run tests concurrently with max concurrency limit
     // Each test will create its own fresh session
     this.results = await runWithConcurrency(
       testFiles,
       this.config.maxConcurrency,
-      async (testFile: string) => {
-        const testCase = await parseTestCase(
-          testFile,
-          this.config.timeout,
-          this.config.llmModel
-        );
+      async (testFile: string, index: number) => {
+        const testCase = testCases[index];
 
         if (!testCase) {
           // Create error result for unparseable test
-          return {
-            name: "invalid",
-            filePath: testFile,
+          return createTestResult("invalid", testFile, {
             status: "error",
             error: "Failed to parse test case",
-            duration: 0,
-            outputFiles: [],
-          } as TestResult;
-          }
-
-          // Execute test with fresh session (created inside executeTest)
-          const result = await executeTest(
-            this.client!,
-            testCase,
-            testFile,
-            this.config,
-            (sessionId) => this.trackSession(sessionId),
-            (sessionId) => this.untrackSession(sessionId)
-          );
-
-          return result;
+          });
+        }
+
+        // Execute test with fresh session (created inside executeTest)
+        const result = await executeTest(
+          this.client!,
+          testCase,
+          testFile,
+          this.config,
+          (sessionId) => this.trackSession(sessionId),
+          (sessionId) => this.untrackSession(sessionId)
+        );
+
+        return result;
       }
     );
   }
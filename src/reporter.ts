@@ -4,13 +4,13 @@
 
 import * as fs from "fs/promises";
 import chalk from "chalk";
-import { TestResult, TestReport, TestSummary } from "./types";
+import { TestResult, TestReport, TestStatus, TestSummary } from "./types";
 import {
   formatDuration,
   formatSuccessRate,
   getStatusIcon,
   separator,
-  setGitHubOutput,
+  setGitHubOutputs,
 } from "./utils";
 
 /**
@@ -18,20 +18,28 @@ import {
  */
 export function generateReport(results: TestResult[]): TestReport {
   const total = results.length;
-  const passed = results.filter((r) => r.status === "passed").length;
-  const failed = results.filter((r) => r.status === "failed").length;
-  const errors = results.filter((r) => r.status === "error").length;
-  const timeouts = results.filter((r) => r.status === "timeout").length;
-  const notFinished = results.filter((r) => r.status === "not-finished").length;
+
+  // Count all statuses in a single pass
+  const counts: Record<TestStatus, number> = {
+    pending: 0,
+    passed: 0,
+    failed: 0,
+    error: 0,
+    timeout: 0,
+    "not-finished": 0,
+  };
+  for (const result of results) {
+    counts[result.status]++;
+  }
 
   const summary: TestSummary = {
     total,
-    passed,
-    failed,
-    errors,
-    timeouts,
-    notFinished,
-    successRate: formatSuccessRate(passed, total),
+    passed: counts.passed,
+    failed: counts.failed,
+    errors: counts.error,
+    timeouts: counts.timeout,
+    notFinished: counts["not-finished"],
+    successRate: formatSuccessRate(counts.passed, total),
   };
 
   return {
@@ -98,12 +106,15 @@ export async function saveResults(
     await fs.writeFile(outputFile, JSON.stringify(report, null, 2), "utf-8");
     console.log(`💾 Results saved to: ${outputFile}`);
 
-    // Set GitHub Actions outputs
-    await setGitHubOutput("results", JSON.stringify(report));
-    await setGitHubOutput("total-tests", String(report.summary.total));
-    await setGitHubOutput("passed-tests", String(report.summary.passed));
-    await setGitHubOutput("failed-tests", String(report.summary.failed));
-    await setGitHubOutput("results-file", outputFile);
+    // Set GitHub Actions outputs; "results" must stay single-line JSON since
+    // workflows embed it directly in scripts
+    await setGitHubOutputs({
+      results: JSON.stringify(report),
+      "total-tests": String(report.summary.total),
+      "passed-tests": String(report.summary.passed),
+      "failed-tests": String(report.summary.failed),
+      "results-file": outputFile,
+    });
   } catch (error) {
     console.warn(`⚠️  Warning: Failed to save results:`, error);
   }
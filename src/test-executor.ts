@@ -3,7 +3,11 @@
  */
 
 import * as fs from "fs/promises";
+import { createWriteStream } from "fs";
 import * as path from "path";
+import { Readable } from "stream";
+import { pipeline } from "stream/promises";
+import type { ReadableStream } from "stream/web";
 import { BrowserUseClient } from "browser-use-sdk";
 import { TestCase, TestResult, Config } from "./types";
 import {
@@ -12,6 +16,10 @@ import {
   truncate,
   separator,
   parseStatusTag,
+  formatError,
+  sleep,
+  createTestResult,
+  runWithConcurrency,
 } from "./utils";
 
 /**
@@ -25,21 +33,30 @@ export async function executeTest(
   onSessionCreated?: (sessionId: string) => void,
   onSessionClosed?: (sessionId: string) => void
 ): Promise<TestResult> {
-  const result: TestResult = {
-    name: testCase.name,
-    filePath,
-    status: "pending",
-    duration: 0,
-    outputFiles: [],
+  const result = createTestResult(testCase.name, filePath);
+
+  // Buffer log lines and flush them once the test finishes so that output
+  // from concurrently running tests does not interleave
+  const logs: string[] = [];
+  const log = (message: string): void => {
+    logs.push(message);
+  };
+  // Progress details are only kept in verbose mode
+  const debug = (message: string): void => {
+    if (config.verbose) {
+      logs.push(message);
+    }
   };
 
-  console.log(`\n${separator()}`);
-  console.log(`🧪 Running test: ${testCase.name}`);
-  console.log(`📄 File: ${filePath}`);
+  console.log(`▶️  Started test: ${testCase.name}`);
+
+  log(`\n${separator()}`);
+  log(`🧪 Running test: ${testCase.name}`);
+  log(`📄 File: ${filePath}`);
   if (testCase.description) {
-    console.log(`📝 Description: ${testCase.description}`);
+    log(`📝 Description: ${testCase.description}`);
   }
-  console.log(separator());
+  log(separator());
 
   const startTime = Date.now();
 
@@ -47,75 +64,30 @@ export async function executeTest(
 
   try {
     // Create a fresh session for this test
-    console.log(`🔧 Creating new session for test...`);
+    debug(`🔧 Creating new session for test...`);
     session = await client.sessions.createSession();
-    console.log(`✅ Session created: ${session.id}`);
+    debug(`✅ Session created: ${session.id}`);
 
     // Track the session
     if (onSessionCreated) {
       onSessionCreated(session.id);
     }
 
-    // Create task in the session
-    console.log(`🚀 Creating Browser Use task in session ${session.id}...`);
-    console.log(`📋 Task instructions: ${truncate(testCase.task, 200)}...`);
-
-    // Build task instructions with status tag requirement
-    let taskInstructions = testCase.task;
-
-    // Prepend base URL context if configured
-    if (config.baseUrl) {
-      taskInstructions = `Conduct testing at: ${config.baseUrl}\n\n${taskInstructions}`;
-      console.log(`🌐 Base URL: ${config.baseUrl}`);
-    }
-
-    // Add status tag requirement to all tasks
-    const statusTagInstruction = `\n\nIMPORTANT: You must include a status tag in your response to indicate the result:\n- <status>completed</status> if the task was completed successfully till the last step\n- <status>failed</status> if the task failed or encountered errors\n- <status>not-finished</status> if the task could not be completed\n`;
-    taskInstructions = taskInstructions + statusTagInstruction;
-
-    const taskParams: any = {
-      sessionId: session.id,
-      task: taskInstructions,
-    };
-
-    // Only add llm if it's a supported model (optional field)
-    // The SDK expects specific model names, but allows custom models too
-    if (testCase.llmModel) {
-      taskParams.llm = testCase.llmModel;
-    }
-
-    // Add input files if specified
-    if (testCase.inputFiles.length > 0) {
-      taskParams.inputFiles = testCase.inputFiles;
-      console.log(`📎 Input files: ${testCase.inputFiles.join(", ")}`);
-    }
-
-    const task = await client.tasks.createTask(taskParams);
+    // Submit the task, then wait for it to reach a terminal status
+    const task = await submitTest(client, session.id, testCase, config, log, debug);
     result.taskId = task.id;
 
-    console.log(`✅ Task created: ${task.id}`);
-    console.log(`⏳ Waiting for task completion (timeout: ${testCase.timeout}s)...`);
-
-    // Watch task status changes and wait for completion
-    let lastStatus: string | undefined;
-    let taskResult;
-    let finalStatus: string | undefined;
-
-    for await (const update of task.watch()) {
-      if (update.event === 'status') {
-        const status = update.data.status;
-        if (status !== lastStatus) {
-          console.log(`📊 Status: ${status}`);
-          lastStatus = status;
-        }
-
-        // Check if task is complete
-        if (status === "finished" || status === "stopped") {
-          taskResult = update.data;
-          finalStatus = status;
-          break;
-        }
-      }
+    log(`⏳ Waiting for task completion (timeout: ${testCase.timeout}s)...`);
+    const deadline = startTime + testCase.timeout * 1000;
+    const { finalStatus, taskResult, timedOut } = await awaitTest(client, task, deadline, log, debug);
+
+    if (timedOut) {
+      result.duration = (Date.now() - startTime) / 1000;
+      result.status = "timeout";
+      result.error = `Test exceeded timeout of ${testCase.timeout}s`;
+      log(`⏱️  Test TIMEOUT after ${result.duration.toFixed(2)}s`);
+      log(`💥 Error: ${result.error}`);
+      return result;
     }
 
     if (!taskResult) {
@@ -132,54 +104,54 @@ export async function executeTest(
 
       if (statusTag === "completed") {
         result.status = "passed";
-        console.log(`✅ Test PASSED in ${result.duration.toFixed(2)}s`);
-        console.log(`📊 Status tag: <status>completed</status>`);
-        console.log(`📤 Output: ${taskResult.output}`);
+        log(`✅ Test PASSED in ${result.duration.toFixed(2)}s`);
+        log(`📊 Status tag: <status>completed</status>`);
+        log(`📤 Output: ${taskResult.output}`);
       } else if (statusTag === "failed") {
         result.status = "failed";
         result.error = "Browser Use reported task failure (status tag: failed)";
-        console.log(`❌ Test FAILED in ${result.duration.toFixed(2)}s`);
-        console.log(`📊 Status tag: <status>failed</status>`);
-        console.log(`💥 Reason: ${result.error}`);
-        console.log(`📤 Output: ${taskResult.output}`);
+        log(`❌ Test FAILED in ${result.duration.toFixed(2)}s`);
+        log(`📊 Status tag: <status>failed</status>`);
+        log(`💥 Reason: ${result.error}`);
+        log(`📤 Output: ${taskResult.output}`);
       } else if (statusTag === "not-finished") {
         result.status = "not-finished";
         result.error = "Browser Use could not complete the task (status tag: not-finished)";
-        console.log(`⚠️  Test NOT FINISHED in ${result.duration.toFixed(2)}s`);
-        console.log(`📊 Status tag: <status>not-finished</status>`);
-        console.log(`💥 Reason: ${result.error}`);
-        console.log(`📤 Output: ${taskResult.output}`);
+        log(`⚠️  Test NOT FINISHED in ${result.duration.toFixed(2)}s`);
+        log(`📊 Status tag: <status>not-finished</status>`);
+        log(`💥 Reason: ${result.error}`);
+        log(`📤 Output: ${taskResult.output}`);
       } else {
         // No status tag found - default to passed for backward compatibility
         result.status = "passed";
-        console.log(`✅ Test PASSED in ${result.duration.toFixed(2)}s`);
-        console.log(`⚠️  Warning: No status tag found in output (defaulting to passed)`);
-        console.log(`📤 Output: ${taskResult.output}`);
+        log(`✅ Test PASSED in ${result.duration.toFixed(2)}s`);
+        log(`⚠️  Warning: No status tag found in output (defaulting to passed)`);
+        log(`📤 Output: ${taskResult.output}`);
       }
     } else if (finalStatus === "stopped") {
       // Task was stopped - likely due to timeout or manual intervention
       if (result.duration >= testCase.timeout) {
         result.status = "timeout";
         result.error = `Test exceeded timeout of ${testCase.timeout}s`;
-        console.log(`⏱️  Test TIMEOUT after ${result.duration.toFixed(2)}s`);
-        console.log(`💥 Error: ${result.error}`);
+        log(`⏱️  Test TIMEOUT after ${result.duration.toFixed(2)}s`);
+        log(`💥 Error: ${result.error}`);
       } else {
         result.status = "failed";
         result.error = "Task was stopped before completion";
-        console.log(`❌ Test FAILED in ${result.duration.toFixed(2)}s`);
-        console.log(`💥 Error: ${result.error}`);
+        log(`❌ Test FAILED in ${result.duration.toFixed(2)}s`);
+        log(`💥 Error: ${result.error}`);
       }
     } else {
       result.status = "failed";
       result.error = `Unexpected task status: ${finalStatus}`;
-      console.log(`❌ Test FAILED in ${result.duration.toFixed(2)}s`);
-      console.log(`💥 Error: ${result.error}`);
+      log(`❌ Test FAILED in ${result.duration.toFixed(2)}s`);
+      log(`💥 Error: ${result.error}`);
     }
 
     // Handle output files (only for passed tests)
     if (result.status === "passed" && taskResult.outputFiles && taskResult.outputFiles.length > 0) {
       result.outputFiles = taskResult.outputFiles.map((file: any) => file.id);
-      console.log(`📁 Output files: ${taskResult.outputFiles.length}`);
+      log(`📁 Output files: ${taskResult.outputFiles.length}`);
 
       if (config.saveOutputs) {
         await saveOutputFiles(
@@ -187,38 +159,174 @@ export async function executeTest(
           task.id,
           taskResult.outputFiles,
           testCase.name,
-          config.outputDir
+          config.outputDir,
+          log
         );
       }
     }
   } catch (error) {
     result.duration = (Date.now() - startTime) / 1000;
     result.status = "failed";
-    result.error = error instanceof Error ? error.message : String(error);
+    result.error = formatError(error);
 
-    console.log(`❌ Test FAILED in ${result.duration.toFixed(2)}s`);
-    console.log(`💥 Error: ${result.error}`);
+    log(`❌ Test FAILED in ${result.duration.toFixed(2)}s`);
+    log(`💥 Error: ${result.error}`);
   } finally {
     // Always cleanup session after test completes
     if (session) {
       try {
-        console.log(`🧹 Cleaning up session ${session.id}...`);
+        debug(`🧹 Cleaning up session ${session.id}...`);
         await client.sessions.updateSession(session.id, { action: "stop" });
-        console.log(`✅ Session ${session.id} stopped`);
+        debug(`✅ Session ${session.id} stopped`);
 
         // Untrack the session
         if (onSessionClosed) {
           onSessionClosed(session.id);
         }
       } catch (error) {
-        console.warn(`⚠️  Warning: Failed to cleanup session ${session.id}:`, error);
+        log(`⚠️  Warning: Failed to cleanup session ${session.id}: ${formatError(error)}`);
       }
     }
+
+    // Flush buffered output for this test in a single write
+    console.log(logs.join("\n"));
   }
 
   return result;
 }
 
+/**
+ * Status tag requirement appended to every task
+ */
+const STATUS_TAG_INSTRUCTION = `\n\nIMPORTANT: You must include a status tag in your response to indicate the result:\n- <status>completed</status> if the task was completed successfully till the last step\n- <status>failed</status> if the task failed or encountered errors\n- <status>not-finished</status> if the task could not be completed\n`;
+
+/**
+ * Submit a test case as a Browser Use task in the given session
+ */
+async function submitTest(
+  client: BrowserUseClient,
+  sessionId: string,
+  testCase: TestCase,
+  config: Config,
+  log: (message: string) => void,
+  debug: (message: string) => void
+): Promise<any> {
+  debug(`🚀 Creating Browser Use task in session ${sessionId}...`);
+  debug(`📋 Task instructions: ${truncate(testCase.task, 200)}...`);
+
+  // Build task instructions with status tag requirement
+  let taskInstructions = testCase.task;
+
+  // Prepend base URL context if configured
+  if (config.baseUrl) {
+    taskInstructions = `Conduct testing at: ${config.baseUrl}\n\n${taskInstructions}`;
+    log(`🌐 Base URL: ${config.baseUrl}`);
+  }
+
+  const taskParams: any = {
+    sessionId,
+    task: taskInstructions + STATUS_TAG_INSTRUCTION,
+  };
+
+  // Only add llm if it's a supported model (optional field)
+  // The SDK expects specific model names, but allows custom models too
+  if (testCase.llmModel) {
+    taskParams.llm = testCase.llmModel;
+  }
+
+  // Add input files if specified
+  if (testCase.inputFiles.length > 0) {
+    taskParams.inputFiles = testCase.inputFiles;
+    log(`📎 Input files: ${testCase.inputFiles.join(", ")}`);
+  }
+
+  const task = await client.tasks.createTask(taskParams);
+  log(`✅ Task created: ${task.id}`);
+
+  return task;
+}
+
+/**
+ * Task statuses that end a test
+ */
+const TERMINAL_STATUSES = new Set(["finished", "stopped"]);
+
+/**
+ * Watch a submitted task until it reaches a terminal status
+ *
+ * Falls back to polling with exponential backoff if the status stream
+ * fails or ends before the task is done. Polling stops at `deadline`
+ * (epoch milliseconds, measured from the start of the test).
+ */
+async function awaitTest(
+  client: BrowserUseClient,
+  task: any,
+  deadline: number,
+  log: (message: string) => void,
+  debug: (message: string) => void
+): Promise<{ finalStatus?: string; taskResult?: any; timedOut?: boolean }> {
+  let lastStatus: string | undefined;
+  const logStatus = (status: string): void => {
+    if (status !== lastStatus) {
+      debug(`📊 Status: ${status}`);
+      lastStatus = status;
+    }
+  };
+
+  try {
+    for await (const update of task.watch()) {
+      if (update.event === 'status') {
+        const status = update.data.status;
+        logStatus(status);
+
+        // Check if task is complete
+        if (TERMINAL_STATUSES.has(status)) {
+          return { finalStatus: status, taskResult: update.data };
+        }
+      }
+    }
+  } catch (error) {
+    log(`⚠️  Warning: Status stream failed: ${formatError(error)}`);
+  }
+
+  log(`🔁 Status stream ended before the task finished, polling task ${task.id}...`);
+  let delay = 1000;
+
+  // Always poll at least once, and poll one final time once the deadline
+  // is reached, so a task that finished in the meantime is not missed
+  for (;;) {
+    const pastDeadline = Date.now() >= deadline;
+
+    try {
+      const taskView: any = await client.tasks.getTask(task.id);
+      logStatus(taskView.status);
+
+      if (TERMINAL_STATUSES.has(taskView.status)) {
+        return { finalStatus: taskView.status, taskResult: taskView };
+      }
+    } catch (error) {
+      // Transient API errors shouldn't fail the test; keep backing off
+      log(`⚠️  Warning: Failed to poll task ${task.id}: ${formatError(error)}`);
+    }
+
+    if (pastDeadline) {
+      break;
+    }
+
+    // Never sleep past the deadline
+    await sleep(Math.max(0, Math.min(delay, deadline - Date.now())));
+    delay = Math.min(delay * 1.5, 5000);
+  }
+
+  log(`⏱️  Deadline reached while polling task ${task.id}`);
+  return { timedOut: true };
+}
+
+/**
+ * Maximum number of output files downloaded at once per test
+ */
+const MAX_PARALLEL_DOWNLOADS = 8;
+
 /**
  * Save output files from a Browser Use task
  */
@@ -227,13 +335,32 @@ async function saveOutputFiles(
   taskId: string,
   outputFiles: Array<any>,
   testName: string,
-  outputDir: string
+  outputDir: string,
+  log: (message: string) => void
 ): Promise<void> {
   try {
     const testOutputDir = path.join(outputDir, sanitizeFilename(testName));
     await ensureDir(testOutputDir);
 
+    // Files sharing a name would be written to the same path concurrently,
+    // so disambiguate duplicates with the file id before downloading
+    const nameCounts = new Map<string, number>();
     for (const fileObj of outputFiles) {
+      nameCounts.set(fileObj.name, (nameCounts.get(fileObj.name) ?? 0) + 1);
+    }
+    const uniqueName = (fileObj: any): string => {
+      if (nameCounts.get(fileObj.name) === 1) {
+        return fileObj.name;
+      }
+      const ext = path.extname(fileObj.name);
+      return `${path.basename(fileObj.name, ext)}-${fileObj.id}${ext}`;
+    };
+
+    // Downloads are pure network I/O, so run several at once
+    await runWithConcurrency(outputFiles, MAX_PARALLEL_DOWNLOADS, async (fileObj) => {
+      const filePath = path.join(testOutputDir, uniqueName(fileObj));
+      const partialPath = `${filePath}.part`;
+
       try {
         // Get presigned URL for download
         const urlResponse = await client.files.getTaskOutputFilePresignedUrl(
@@ -243,23 +370,25 @@ async function saveOutputFiles(
 
         // Fetch the file content from the presigned URL
         const response = await fetch(urlResponse.downloadUrl);
-        if (!response.ok) {
+        if (!response.ok || !response.body) {
           throw new Error(`Failed to download file: ${response.statusText}`);
         }
 
-        const fileData = await response.arrayBuffer();
-        const filePath = path.join(testOutputDir, fileObj.name);
-
-        await fs.writeFile(filePath, Buffer.from(fileData));
-        console.log(`💾 Saved output file: ${filePath}`);
-      } catch (error) {
-        console.warn(
-          `⚠️  Warning: Failed to save output file '${fileObj.name}':`,
-          error
+        // Stream the body to a temporary file instead of buffering the whole
+        // file, and only move it into place once the download completed
+        await pipeline(
+          Readable.fromWeb(response.body as ReadableStream<Uint8Array>),
+          createWriteStream(partialPath)
         );
+        await fs.rename(partialPath, filePath);
+        log(`💾 Saved output file: ${filePath}`);
+      } catch (error) {
+        // Don't leave a truncated file behind if the download failed midway
+        await fs.rm(partialPath, { force: true }).catch(() => {});
+        log(`⚠️  Warning: Failed to save output file '${fileObj.name}': ${formatError(error)}`);
       }
-    }
+    });
   } catch (error) {
-    console.warn(`⚠️  Warning: Failed to save output files:`, error);
+    log(`⚠️  Warning: Failed to save output files: ${formatError(error)}`);
   }
 }
@@ -4,69 +4,169 @@
 
 import * as fs from "fs/promises";
 import * as path from "path";
-import matter from "gray-matter";
-import { TestCase, TestMetadata } from "./types";
+import { load } from "js-yaml";
+import { TestCase, TestCaseDefaults, TestMetadata } from "./types";
+import { ensureDir } from "./utils";
+
+/**
+ * Default location of the on-disk parse cache
+ */
+export const PARSE_CACHE_FILE = ".monkey-test-cache/parsed.json";
+
+/**
+ * Parse cache format version. Bump whenever parsing logic or the TestCase
+ * shape changes so caches written by older builds are discarded.
+ */
+const PARSE_CACHE_VERSION = 2;
+
+interface ParseCacheEntry {
+  // File mtime/size and defaults the test case was parsed with
+  key: string;
+  testCase: TestCase;
+}
+
+/**
+ * Parsed test cases keyed by file path. Entries are looked up in
+ * `previous` (loaded from disk) and recorded in `current` when parsed or
+ * hit, so only files seen in this run are saved back.
+ */
+export interface ParseCache {
+  previous: Record<string, ParseCacheEntry>;
+  current: Record<string, ParseCacheEntry>;
+}
+
+/**
+ * Load the parse cache from disk, returning an empty cache if missing,
+ * invalid or written by a different cache version
+ */
+export async function loadParseCache(cacheFile: string = PARSE_CACHE_FILE): Promise<ParseCache> {
+  const cache: ParseCache = { previous: {}, current: {} };
+
+  try {
+    const data = JSON.parse(await fs.readFile(cacheFile, "utf-8"));
+    // Caches from other versions are ignored and overwritten on save
+    if (data && data.version === PARSE_CACHE_VERSION && data.entries) {
+      cache.previous = data.entries;
+    }
+  } catch {
+    // Missing or unreadable cache - start empty
+  }
+
+  return cache;
+}
+
+/**
+ * Save the entries used in this run to disk
+ */
+export async function saveParseCache(
+  cache: ParseCache,
+  cacheFile: string = PARSE_CACHE_FILE
+): Promise<void> {
+  try {
+    await ensureDir(path.dirname(cacheFile));
+    const data = { version: PARSE_CACHE_VERSION, entries: cache.current };
+    await fs.writeFile(cacheFile, JSON.stringify(data), "utf-8");
+  } catch (error) {
+    console.warn(`⚠️  Warning: Failed to save parse cache:`, error);
+  }
+}
+
+/**
+ * Build the per-run test case defaults once, instead of per parsed file
+ */
+export function createTestCaseDefaults(timeout: number, llmModel: string): TestCaseDefaults {
+  return { timeout, llmModel, cacheKey: `${timeout}:${llmModel}` };
+}
+
+/**
+ * Leading YAML frontmatter block delimited by "---" lines
+ */
+const FRONTMATTER_RE = /^\uFEFF?---[ \t]*\r?\n(?:([\s\S]*?)\r?\n)?---[ \t]*(?:\r?\n|$)/;
+
+/**
+ * "# Task" / "## Task" section bodies, each up to the next heading line
+ */
+const TASK_SECTION_RE = /^[ \t]*#{1,2}[ \t]+task[ \t]*\r?$([\s\S]*?)(?=^[ \t]*#|(?![\s\S]))/gim;
+
+/**
+ * "# Expected Output" / "## Expected Output" section bodies, each up to the next heading line
+ */
+const EXPECTED_OUTPUT_SECTION_RE = /^[ \t]*#{1,2}[ \t]+expected output[ \t]*\r?$([\s\S]*?)(?=^[ \t]*#|(?![\s\S]))/gim;
+
+/**
+ * Join the lines of every matching section in order, or return null if no
+ * section has any lines. `content` must not end in whitespace, so a bare
+ * heading at the end of the document counts as having no lines.
+ */
+function extractSections(content: string, sectionRe: RegExp): string | null {
+  const sections: string[] = [];
+
+  for (const match of content.matchAll(sectionRe)) {
+    // The capture starts with the heading's line break and ends with the
+    // line break before the next heading; neither belongs to the section
+    const body = (match[1] ?? "").replace(/^\r?\n/, "");
+    if (body) {
+      sections.push(body.replace(/\r?\n$/, ""));
+    }
+  }
+
+  return sections.length > 0 ? sections.join("\n").trim() : null;
+}
+
+/**
+ * Split a markdown document into its YAML frontmatter and body
+ */
+export function splitFrontmatter(text: string): { data: TestMetadata; content: string } {
+  const match = FRONTMATTER_RE.exec(text);
+  if (!match) {
+    return { data: {}, content: text };
+  }
+
+  const data = match[1] ? load(match[1]) : null;
+
+  return {
+    data: data && typeof data === "object" ? (data as TestMetadata) : {},
+    content: text.slice(match[0].length),
+  };
+}
 
 /**
  * Parse a markdown test case file
+ *
+ * If a cache is given, files whose mtime and size are unchanged since the
+ * last parse are served from it without being read.
  */
 export async function parseTestCase(
   filePath: string,
-  defaultTimeout: number,
-  defaultLlmModel: string
+  defaults: TestCaseDefaults,
+  cache?: ParseCache
 ): Promise<TestCase | null> {
   try {
-    const content = await fs.readFile(filePath, "utf-8");
-    const parsed = matter(content);
-    
-    const metadata = parsed.data as TestMetadata;
-    let taskContent = parsed.content.trim();
-    let expectedOutput = metadata.expected_output;
+    let cacheKey: string | undefined;
+    if (cache) {
+      const stats = await fs.stat(filePath);
+      cacheKey = `${stats.mtimeMs}:${stats.size}:${defaults.cacheKey}`;
 
-    // Parse sections from markdown content
-    const lines = taskContent.split("\n");
-    const taskLines: string[] = [];
-    const expectedOutputLines: string[] = [];
-    let inTaskSection = false;
-    let inExpectedOutputSection = false;
-
-    for (const line of lines) {
-      const trimmed = line.trim().toLowerCase();
-      
-      // Check for Task section
-      if (trimmed === "# task" || trimmed === "## task") {
-        inTaskSection = true;
-        inExpectedOutputSection = false;
-        continue;
-      } 
-      // Check for Expected Output section
-      else if (trimmed === "# expected output" || trimmed === "## expected output") {
-        inTaskSection = false;
-        inExpectedOutputSection = true;
-        continue;
-      }
-      // New section started
-      else if (line.trim().startsWith("#")) {
-        inTaskSection = false;
-        inExpectedOutputSection = false;
-      }
-      
-      // Collect lines based on current section
-      if (inTaskSection) {
-        taskLines.push(line);
-      } else if (inExpectedOutputSection) {
-        expectedOutputLines.push(line);
+      const cached = cache.previous[filePath];
+      if (cached && cached.key === cacheKey) {
+        cache.current[filePath] = cached;
+        return cached.testCase;
       }
     }
 
-    // Use parsed task content if found
-    if (taskLines.length > 0) {
-      taskContent = taskLines.join("\n").trim();
-    }
+    const content = await fs.readFile(filePath, "utf-8");
+    const parsed = splitFrontmatter(content);
+
+    const metadata = parsed.data;
+    let expectedOutput = metadata.expected_output;
+
+    // Use the "# Task" sections if present, otherwise the whole body
+    const body = parsed.content.trimEnd();
+    const taskContent = extractSections(body, TASK_SECTION_RE) ?? body.trimStart();
 
-    // Use parsed expected output if found (and not already in metadata)
-    if (!expectedOutput && expectedOutputLines.length > 0) {
-      expectedOutput = expectedOutputLines.join("\n").trim();
+    // Use the "# Expected Output" sections if present (and not already in metadata)
+    if (!expectedOutput) {
+      expectedOutput = extractSections(body, EXPECTED_OUTPUT_SECTION_RE) ?? expectedOutput;
     }
 
     // If no task content found, return null
@@ -80,12 +180,16 @@ export async function parseTestCase(
       name: metadata.name || path.basename(filePath, path.extname(filePath)),
       description: metadata.description || "",
       task: taskContent,
-      timeout: metadata.timeout || defaultTimeout,
-      llmModel: metadata.llm_model || defaultLlmModel,
+      timeout: metadata.timeout || defaults.timeout,
+      llmModel: metadata.llm_model || defaults.llmModel,
       inputFiles: metadata.input_files || [],
       expectedOutput: expectedOutput,
     };
 
+    if (cache && cacheKey) {
+      cache.current[filePath] = { key: cacheKey, testCase };
+    }
+
     return testCase;
   } catch (error) {
     console.error(`❌ Error parsing test case '${filePath}':`, error);
@@ -93,6 +197,11 @@ export async function parseTestCase(
   }
 }
 
+/**
+ * Markdown test file extensions
+ */
+const TEST_FILE_RE = /\.(md|markdown)$/i;
+
 /**
  * Find all markdown test files in a directory
  */
@@ -100,21 +209,22 @@ export async function findTestFiles(testDirectory: string): Promise<string[]> {
   try {
     const files: string[] = [];
     
+    // Dirent type info comes from readdir itself, so no per-entry stat is
+    // needed; sibling directories are walked concurrently
     async function walk(dir: string): Promise<void> {
       const entries = await fs.readdir(dir, { withFileTypes: true });
-      
+      const subdirs: Promise<void>[] = [];
+
+      // Only join paths for entries that are actually used
       for (const entry of entries) {
-        const fullPath = path.join(dir, entry.name);
-        
         if (entry.isDirectory()) {
-          await walk(fullPath);
-        } else if (entry.isFile()) {
-          const ext = path.extname(entry.name).toLowerCase();
-          if (ext === ".md" || ext === ".markdown") {
-            files.push(fullPath);
-          }
+          subdirs.push(walk(path.join(dir, entry.name)));
+        } else if (entry.isFile() && TEST_FILE_RE.test(entry.name)) {
+          files.push(path.join(dir, entry.name));
         }
       }
+
+      await Promise.all(subdirs);
     }
     
     await walk(testDirectory);
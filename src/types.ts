@@ -24,6 +24,13 @@ export interface TestCase {
   baseUrl?: string;
 }
 
+export interface TestCaseDefaults {
+  timeout: number;
+  llmModel: string;
+  // Precomputed suffix for parse cache keys
+  cacheKey: string;
+}
+
 export interface TestResult {
   name: string;
   filePath: string;
@@ -59,6 +66,9 @@ export interface Config {
   saveOutputs: boolean;
   outputDir: string;
   maxConcurrency: number;
+  verbose: boolean;
+  parseCache: boolean;
+  parseCacheFile: string;
   baseUrl?: string;
   // Diff-based test generation options
   fromCommit?: string;
@@ -3,6 +3,7 @@
  */
 
 import * as fs from "fs/promises";
+import { TestResult } from "./types";
 
 
 /**
@@ -50,20 +51,32 @@ export function formatSuccessRate(passed: number, total: number): string {
  * Set GitHub Actions output variable
  */
 export async function setGitHubOutput(name: string, value: string): Promise<void> {
+  await setGitHubOutputs({ [name]: value });
+}
+
+/**
+ * Set multiple GitHub Actions output variables with a single append
+ */
+export async function setGitHubOutputs(outputs: Record<string, string>): Promise<void> {
   const githubOutput = process.env.GITHUB_OUTPUT;
   if (!githubOutput) return;
 
-  try {
+  let buffer = "";
+  for (const [name, value] of Object.entries(outputs)) {
     // Handle multiline values
     if (value.includes("\n")) {
       const delimiter = "EOF";
-      const output = `${name}<<${delimiter}\n${value}\n${delimiter}\n`;
-      await fs.appendFile(githubOutput, output);
+      buffer += `${name}<<${delimiter}\n${value}\n${delimiter}\n`;
     } else {
-      await fs.appendFile(githubOutput, `${name}=${value}\n`);
+      buffer += `${name}=${value}\n`;
     }
+  }
+
+  try {
+    await fs.appendFile(githubOutput, buffer);
   } catch (error) {
-    console.warn(`⚠️  Warning: Failed to set GitHub output '${name}':`, error);
+    const names = Object.keys(outputs).join("', '");
+    console.warn(`⚠️  Warning: Failed to set GitHub output '${names}':`, error);
   }
 }
 
@@ -107,6 +120,34 @@ export function truncate(str: string, maxLength: number): string {
   return str.substring(0, maxLength - 3) + "...";
 }
 
+/**
+ * Create a test result with every field initialized in a fixed order, so
+ * all results share one object shape
+ */
+export function createTestResult(
+  name: string,
+  filePath: string,
+  overrides: Partial<TestResult> = {}
+): TestResult {
+  return {
+    name,
+    filePath,
+    status: overrides.status ?? "pending",
+    output: overrides.output,
+    error: overrides.error,
+    duration: overrides.duration ?? 0,
+    taskId: overrides.taskId,
+    outputFiles: overrides.outputFiles ?? [],
+  };
+}
+
+/**
+ * Format an unknown error value as a message string
+ */
+export function formatError(error: unknown): string {
+  return error instanceof Error ? error.message : String(error);
+}
+
 /**
  * Sleep for specified milliseconds
  */
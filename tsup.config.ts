@@ -17,7 +17,7 @@ export default defineConfig({
     "browser-use-sdk",
     "chalk",
     "glob",
-    "gray-matter",
+    "js-yaml",
   ],
   shims: false,
   onSuccess: "chmod +x dist/index.js",